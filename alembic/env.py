@@ -6,11 +6,10 @@ Run migrations with the standard Alembic CLI after setting DATABASE_URL.
 """
 from logging.config import fileConfig
 import os
-from sqlalchemy import pool, engine_from_config
+from sqlalchemy import pool
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Connection
 from alembic import context
-import asyncio
 from app.config import settings
 from app.db import Base
 from app.logger import get_logger
@@ -40,11 +39,13 @@ def do_run_migrations(connection: Connection):
         context.run_migrations()
 
 def run_migrations_online():
-    """Run migrations in 'online' mode using async engine."""
-    connectable = create_engine(config.get_main_option('sqlalchemy.url'))
-
-    with connectable.connect() as connection:
-        do_run_migrations(connection)
+    """Run migrations in 'online' mode over a single pool-less connection."""
+    connectable = create_engine(config.get_main_option('sqlalchemy.url'), poolclass=pool.NullPool)
+    try:
+        with connectable.connect() as connection:
+            do_run_migrations(connection)
+    finally:
+        connectable.dispose()
 
 if context.is_offline_mode():
     run_migrations_offline()
@@ -0,0 +1,47 @@
+
+"""Add composite indexes covering the hot CallRecord query paths.
+
+Revision ID: a1f3c9d4b2e1
+Revises:
+Create Date: 2026-08-30
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'a1f3c9d4b2e1'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the composite indexes without locking writes on Postgres.
+
+    CONCURRENTLY cannot run inside a transaction, hence the autocommit
+    block; on SQLite the flag is ignored and the index builds normally.
+    if_not_exists keeps the migration safe on databases where init_db()'s
+    create_all already built these indexes from the model definitions.
+    The unique constraint on callinsight.call_id already provides the
+    index used by the insight join, so no extra index is needed there.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_callrecord_company_processed_start',
+            'callrecord',
+            ['company_id', 'is_processed', 'start_time'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_callrecord_company_duration',
+            'callrecord',
+            ['company_id', 'duration'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_callrecord_company_processed_start', table_name='callrecord', postgresql_concurrently=True)
+        op.drop_index('ix_callrecord_company_duration', table_name='callrecord', postgresql_concurrently=True)
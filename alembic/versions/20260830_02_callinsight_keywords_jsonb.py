@@ -0,0 +1,33 @@
+
+"""Store callinsight.keywords as JSONB with a GIN index.
+
+Revision ID: c7e2a8f05d43
+Revises: a1f3c9d4b2e1
+Create Date: 2026-08-30
+"""
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'c7e2a8f05d43'
+down_revision = 'a1f3c9d4b2e1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Convert the text json column to jsonb and index it for containment.
+
+    Postgres-only: SQLite's generic JSON storage is unchanged there.
+    """
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column('callinsight', 'keywords', type_=postgresql.JSONB(), postgresql_using='keywords::jsonb')
+    op.create_index('ix_callinsight_keywords_gin', 'callinsight', ['keywords'], postgresql_using='gin')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_callinsight_keywords_gin', table_name='callinsight')
+    op.alter_column('callinsight', 'keywords', type_=postgresql.JSON(), postgresql_using='keywords::json')
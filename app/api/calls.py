@@ -1,9 +1,10 @@
 
 """API endpoints for call ingestion and retrieval, with logging and defensive error handling."""
-from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, Query, Response
+from sqlalchemy import select, tuple_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
+import base64
 from deps import get_company_by_api_key, get_db
 from models import CallRecord, CallInsight
 from schemas import CallCreate, CallRead, InsightRead
@@ -11,10 +12,22 @@ from storage import save_upload_file
 from tasks import process_call_record as celery_process_call
 from datetime import datetime
 from logger import get_logger
+import logging
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+def _encode_cursor(start_time: Optional[datetime], record_id: int) -> str:
+    """Encode a (start_time, id) keyset position as an opaque cursor."""
+    raw = f"{start_time.isoformat() if start_time else ''}|{record_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def _decode_cursor(cursor: str):
+    """Decode a cursor back into (start_time, id); raises ValueError if malformed."""
+    raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    ts, _, record_id = raw.rpartition('|')
+    return (datetime.fromisoformat(ts) if ts else None, int(record_id))
+
 @router.post("/", status_code=201)
 async def create_call(call_meta: CallCreate = Depends(), file: UploadFile = File(...), company=Depends(get_company_by_api_key), db: AsyncSession = Depends(get_db)):
     """Register a new call record and enqueue background processing task.
@@ -24,8 +37,9 @@ async def create_call(call_meta: CallCreate = Depends(), file: UploadFile = File
     are logged and a 500 response is returned.
     """
     try:
-        logger.debug("Received create_call request for company id=%s, call_id=%s", getattr(company, 'id', None), call_meta.call_id)
-        saved_path = save_upload_file(file, company.id, file.filename)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received create_call request for company id=%s, call_id=%s", company.id, call_meta.call_id)
+        saved_path = await save_upload_file(file, company.id, file.filename)
         cr = CallRecord(
             company_id=company.id,
             call_id=call_meta.call_id,
@@ -53,6 +67,7 @@ async def create_call(call_meta: CallCreate = Depends(), file: UploadFile = File
 
 @router.get("/", response_model=List[CallRead])
 async def list_calls(
+    response: Response,
     company=Depends(get_company_by_api_key),
     db: AsyncSession = Depends(get_db),
     from_date: Optional[str] = Query(None),
@@ -61,14 +76,19 @@ async def list_calls(
     duration_gt: Optional[int] = Query(None),
     duration_lt: Optional[int] = Query(None),
     limit: int = Query(20, ge=1, le=200),
-    offset: int = Query(0, ge=0)
+    cursor: Optional[str] = Query(None)
 ):
     """List call records for the authenticated company with optional filters and pagination.
 
+    Pagination is keyset-based: pass the `X-Next-Cursor` header from the
+    previous page as `cursor` to fetch the next one. Cost stays O(limit)
+    regardless of how deep the client pages.
+
     Errors are logged and translated into HTTPException(500).
     """
     try:
-        logger.debug("Listing calls for company id=%s", getattr(company, 'id', None))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Listing calls for company id=%s", company.id)
         q = select(CallRecord).where(CallRecord.company_id == company.id)
         if from_date:
             try:
@@ -88,11 +108,28 @@ async def list_calls(
             q = q.where(CallRecord.duration >= duration_gt)
         if duration_lt is not None:
             q = q.where(CallRecord.duration <= duration_lt)
-        q = q.offset(offset).limit(limit)
+        if cursor:
+            try:
+                cur_ts, cur_id = _decode_cursor(cursor)
+            except (ValueError, UnicodeDecodeError) as exc:
+                logger.debug("Invalid cursor: %s", exc)
+                raise HTTPException(status_code=400, detail="invalid cursor")
+            if cur_ts is not None:
+                # NULL start_times sort after real timestamps, so keep them
+                # reachable from timestamped cursor positions.
+                q = q.where(or_(
+                    tuple_(CallRecord.start_time, CallRecord.id) < (cur_ts, cur_id),
+                    CallRecord.start_time.is_(None),
+                ))
+            else:
+                q = q.where(CallRecord.start_time.is_(None), CallRecord.id < cur_id)
+        q = q.order_by(CallRecord.start_time.desc().nullslast(), CallRecord.id.desc()).limit(limit)
         res = await db.execute(q)
         rows = res.scalars().all()
+        if len(rows) == limit:
+            response.headers["X-Next-Cursor"] = _encode_cursor(rows[-1].start_time, rows[-1].id)
         logger.info("Returned %s call records for company id=%s", len(rows), company.id)
-        return [CallRead.from_orm(r) for r in rows]
+        return [CallRead.model_validate(r) for r in rows]
     except HTTPException:
         raise
     except Exception as exc:
@@ -103,24 +140,28 @@ async def list_calls(
 async def get_insight(call_id: str, company=Depends(get_company_by_api_key), db: AsyncSession = Depends(get_db)):
     """Return processed insight for a call, or 404 if not ready."""
     try:
-        logger.debug("Fetching insight for call_id=%s company_id=%s", call_id, getattr(company, 'id', None))
-        q = select(CallRecord).where(CallRecord.company_id == company.id, CallRecord.call_id == call_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fetching insight for call_id=%s company_id=%s", call_id, company.id)
+        # One outer-joined query instead of two sequential round-trips.
+        q = (
+            select(CallRecord.id, CallRecord.is_processed, CallInsight)
+            .join(CallInsight, CallInsight.call_id == CallRecord.id, isouter=True)
+            .where(CallRecord.company_id == company.id, CallRecord.call_id == call_id)
+        )
         res = await db.execute(q)
-        cr = res.scalars().first()
-        if not cr:
+        row = res.first()
+        if not row:
             logger.warning("Call not found: call_id=%s company_id=%s", call_id, company.id)
             raise HTTPException(status_code=404, detail="call not found")
-        if not cr.is_processed:
+        record_id, is_processed, ins = row
+        if not is_processed:
             logger.info("Insight not ready for call_id=%s", call_id)
             raise HTTPException(status_code=404, detail="insight not ready")
-        q2 = select(CallInsight).where(CallInsight.call_id == cr.id)
-        r2 = await db.execute(q2)
-        ins = r2.scalars().first()
         if not ins:
-            logger.error("Insight missing for processed call id=%s", cr.id)
+            logger.error("Insight missing for processed call id=%s", record_id)
             raise HTTPException(status_code=404, detail="insight missing")
         logger.info("Returning insight for call_id=%s", call_id)
-        return InsightRead.from_orm(ins)
+        return InsightRead.model_validate(ins)
     except HTTPException:
         raise
     except Exception as exc:
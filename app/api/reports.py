@@ -1,17 +1,24 @@
 
 """Reports endpoints with logging and error handling."""
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import select, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
+from cache import cache_get, cache_set
 from deps import get_company_by_api_key, get_db
 from models import CallRecord, CallInsight
 from tasks import generate_company_report as celery_generate_report
 from collections import Counter
 from logger import get_logger
+import logging
+import orjson
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Reports aggregate thousands of rows and dashboards poll them; a short
+# TTL keeps hits to a single Redis GET while bounding staleness.
+REPORT_CACHE_TTL = 60
+
 @router.get("/")
 async def get_report(company=Depends(get_company_by_api_key), db: AsyncSession = Depends(get_db)):
     """Compute aggregated analytics for the authenticated company.
@@ -21,41 +28,84 @@ async def get_report(company=Depends(get_company_by_api_key), db: AsyncSession =
     errors return HTTP 500.
     """
     try:
-        logger.debug("Computing report for company id=%s", getattr(company, 'id', None))
-        q = select(CallRecord).where(CallRecord.company_id == company.id, CallRecord.is_processed == True)
-        res = await db.execute(q)
-        calls = res.scalars().all()
-        total = len(calls)
-        avg_duration = sum((c.duration or 0) for c in calls) / total if total else 0
-        sentiments = Counter()
-        keywords = Counter()
-        for c in calls:
-            q2 = select(CallInsight).where(CallInsight.call_id == c.id)
-            r2 = await db.execute(q2)
-            ins = r2.scalars().first()
-            if ins:
-                sentiments.update([ins.sentiment.value if ins.sentiment else 'Unknown'])
-                if isinstance(ins.keywords, dict):
-                    for _, vals in ins.keywords.items():
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Computing report for company id=%s", company.id)
+        cache_key = f"report:{company.id}"
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return orjson.loads(cached)
+        # Aggregate in SQL so the DB returns a handful of rows instead of
+        # every processed call.
+        processed = (CallRecord.company_id == company.id, CallRecord.is_processed == True)
+        q_totals = select(func.count(), func.avg(CallRecord.duration)).where(*processed)
+        total, avg_duration = (await db.execute(q_totals)).one()
+        avg_duration = float(avg_duration) if avg_duration is not None else 0
+
+        q_sentiments = (
+            select(CallInsight.sentiment, func.count())
+            .join(CallRecord, CallRecord.id == CallInsight.call_id)
+            .where(*processed)
+            .group_by(CallInsight.sentiment)
+        )
+        sentiments = {
+            (s.value if s else 'Unknown'): n
+            for s, n in (await db.execute(q_sentiments)).all()
+        }
+
+        if db.get_bind().dialect.name == 'postgresql':
+            # Unnest every array value in the keywords object and count
+            # server-side; the CASE skips non-array values the same way the
+            # Python path's isinstance checks do.
+            q_keywords = text(
+                "SELECT kw, COUNT(*) AS cnt "
+                "FROM callinsight "
+                "JOIN callrecord ON callrecord.id = callinsight.call_id, "
+                "jsonb_each("
+                "  CASE WHEN jsonb_typeof((callinsight.keywords)::jsonb) = 'object' "
+                "  THEN (callinsight.keywords)::jsonb ELSE '{}'::jsonb END"
+                ") AS kv, "
+                "jsonb_array_elements_text("
+                "  CASE WHEN jsonb_typeof(kv.value) = 'array' THEN kv.value ELSE '[]'::jsonb END"
+                ") AS kw "
+                "WHERE callrecord.company_id = :company_id AND callrecord.is_processed = true "
+                "GROUP BY kw ORDER BY cnt DESC LIMIT 5"
+            )
+            res = await db.execute(q_keywords, {"company_id": company.id})
+            top_keywords = [kw for kw, _ in res.all()]
+        else:
+            # SQLite (dev) has no JSON unnest; pull only the keywords column
+            # and count in Python.
+            q_keywords = (
+                select(CallInsight.keywords)
+                .join(CallRecord, CallRecord.id == CallInsight.call_id)
+                .where(*processed, CallInsight.keywords.isnot(None))
+            )
+            keywords = Counter()
+            for (kw,) in (await db.execute(q_keywords)).all():
+                if isinstance(kw, dict):
+                    for _, vals in kw.items():
                         if isinstance(vals, list):
                             keywords.update(vals)
-        top_keywords = [k for k,_ in keywords.most_common(5)]
+            top_keywords = [k for k, _ in keywords.most_common(5)]
         logger.info("Report computed for company id=%s: total=%s", company.id, total)
-        return {
+        resp = {
             "total_calls": total,
             "avg_duration": avg_duration,
             "sentiment_distribution": dict(sentiments),
             "top_keywords": top_keywords
         }
+        await cache_set(cache_key, orjson.dumps(resp), REPORT_CACHE_TTL)
+        return resp
     except Exception as exc:
-        logger.exception("Failed to compute report for company id=%s: %s", getattr(company, 'id', None), exc)
+        logger.exception("Failed to compute report for company id=%s: %s", company.id, exc)
         raise HTTPException(status_code=500, detail="Internal server error") from exc
 
 @router.post("/")
 async def regen_report(company=Depends(get_company_by_api_key)):
     """Trigger report regeneration via Celery for allowed companies."""
     try:
-        logger.debug("Regenerate report requested for company id=%s", getattr(company, 'id', None))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Regenerate report requested for company id=%s", company.id)
         if not company.can_regen_reports:
             logger.warning("Company id=%s not allowed to regen reports", company.id)
             raise HTTPException(status_code=403, detail="company not allowed to regen reports")
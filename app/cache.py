@@ -0,0 +1,34 @@
+
+"""Async Redis cache helpers sharing one connection pool.
+
+Cache access is best-effort: if Redis is unreachable the helpers log and
+return as if the key were absent, so endpoints fall back to computing.
+"""
+from redis import asyncio as aioredis
+from typing import Optional
+from config import settings
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+_pool = aioredis.ConnectionPool.from_url(
+    settings.REDIS_URL,
+    socket_connect_timeout=0.5,
+    socket_timeout=0.5,
+)
+redis_client = aioredis.Redis(connection_pool=_pool)
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Fetch a cached value, or None if missing or Redis is unavailable."""
+    try:
+        return await redis_client.get(key)
+    except Exception as exc:
+        logger.warning("Cache get failed for key=%s: %s", key, exc)
+        return None
+
+async def cache_set(key: str, value: bytes, ttl: int) -> None:
+    """Store a value with a TTL; failures are logged and swallowed."""
+    try:
+        await redis_client.set(key, value, ex=ttl)
+    except Exception as exc:
+        logger.warning("Cache set failed for key=%s: %s", key, exc)
@@ -13,3 +13,12 @@ celery.conf.task_routes = {
     'app.tasks.process_call_record': {'queue': 'calls'},
     'app.tasks.generate_company_report': {'queue': 'reports'}
 }
+# Explicit broker/backend pool sizing so .delay() from request handlers
+# reuses connections instead of blocking on acquisition under load.
+celery.conf.update(
+    broker_pool_limit=50,
+    broker_transport_options={"visibility_timeout": 3600},
+    result_backend_transport_options={"socket_keepalive": True},
+    task_acks_late=True,
+    worker_prefetch_multiplier=4,
+)
@@ -3,19 +3,30 @@
 Provides a Settings object with type hints for IDE support.
 """
 from pydantic_settings import BaseSettings
-from pathlib import Path
+from functools import lru_cache
 
 class Settings(BaseSettings):
     DEBUG: bool = True
     DATABASE_URL: str = "sqlite+aiosqlite:///./caip_dev_async.db"
     REDIS_URL: str = "redis://localhost:6379/0"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
     MEDIA_ROOT: str = "./media"
     MEDIA_URL: str = "/media/"
 
     class Config:
         env_file = ".env"
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance.
 
-# Ensure media directory exists on startup
-Path(settings.MEDIA_ROOT).mkdir(parents=True, exist_ok=True)
+    Memoized so the environment is parsed once per process; FastAPI routes
+    can depend on this and tests can override it.
+    """
+    return Settings()
+
+# Module-level alias kept for the existing `from config import settings` imports.
+settings = get_settings()
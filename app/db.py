@@ -1,16 +1,24 @@
 
 """Database utilities with logging and error handling."""
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import declarative_base
 from config import settings
 from logger import get_logger
 
 logger = get_logger(__name__)
 
-# Async engine & session factory
-engine = create_async_engine(settings.DATABASE_URL, future=True, echo=False)
-AsyncSessionLocal = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False, autocommit=False)
+# Async engine & session factory. The engine keeps a pool of ready
+# connections so request handlers don't pay connection-setup cost per query.
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=False,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+)
+AsyncSessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
 
 # Declarative base for ORM models
 Base = declarative_base()
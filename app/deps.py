@@ -2,15 +2,36 @@
 """Dependency utilities for FastAPI routes.
 
 Provides `get_db` for async DB session and `get_company_by_api_key` which
-validates the X-API-KEY header and loads the Company instance.
+validates the X-API-KEY header and loads the company for the request.
+Company lookups are cached for a short TTL so steady-state requests skip
+the per-request authentication query.
 """
 from fastapi import Header, HTTPException, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import Optional
+from dataclasses import dataclass
+from cachetools import TTLCache
+import asyncio
 from db import AsyncSessionLocal
 from models import Company
 
+@dataclass(frozen=True)
+class CompanyAuth:
+    """Detached view of a Company handed to request handlers.
+
+    A plain dataclass rather than an ORM instance so cached entries are
+    never bound to a closed session.
+    """
+    id: int
+    name: str
+    can_regen_reports: bool
+
+# api_key -> CompanyAuth. The key set changes rarely; a 60 s TTL bounds
+# staleness if a key is revoked or permissions change.
+_company_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_company_cache_lock = asyncio.Lock()
+
 async def get_db():
     """Yield an async SQLAlchemy session.
 
@@ -20,24 +41,31 @@ async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
 
-async def get_company_by_api_key(x_api_key: Optional[str] = Header(None), db: AsyncSession = Depends(get_db)) -> Company:
-    """Validate X-API-KEY header and return the matching Company.
+async def get_company_by_api_key(x_api_key: Optional[str] = Header(None), db: AsyncSession = Depends(get_db)) -> CompanyAuth:
+    """Validate X-API-KEY header and return the matching company.
 
     Args:
         x_api_key: API key provided by the caller in `X-API-KEY` header.
-        db: AsyncSession dependency.
+        db: AsyncSession dependency, used only on cache misses.
 
     Raises:
         HTTPException 401 if header missing or key invalid.
 
     Returns:
-        Company ORM instance corresponding to the API key.
+        CompanyAuth snapshot corresponding to the API key.
     """
     if not x_api_key:
         raise HTTPException(status_code=401, detail="X-API-KEY header required")
+    async with _company_cache_lock:
+        cached = _company_cache.get(x_api_key)
+    if cached is not None:
+        return cached
     q = select(Company).where(Company.api_key == x_api_key)
     res = await db.execute(q)
     company = res.scalars().first()
     if not company:
         raise HTTPException(status_code=401, detail="Invalid API key")
-    return company
+    auth = CompanyAuth(id=company.id, name=company.name, can_regen_reports=company.can_regen_reports)
+    async with _company_cache_lock:
+        _company_cache[x_api_key] = auth
+    return auth
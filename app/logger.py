@@ -1,32 +1,32 @@
 
 """Centralized logging configuration for CAIP.
 
-Provides `get_logger` which returns a module-level logger configured to log
-to both console and a rotating file handler under `logs/`.
+Provides `get_logger` which returns a module-level logger. Handlers that
+do real I/O (console and rotating file) live behind a shared QueueListener
+thread, so emitting a record from an async handler only enqueues it and
+never blocks the event loop on a disk write.
 """
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from typing import Optional
 from config import settings
 
 LOG_DIR = os.path.join(os.getcwd(), "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
 LOG_FILE = os.path.join(LOG_DIR, "app.log")
 
-def get_logger(name: str = __name__) -> logging.Logger:
-    """Create and return a configured logger.
-
-    Args:
-        name: Logger name (usually __name__ from the calling module).
-
-    Returns:
-        Configured `logging.Logger` instance.
-    """
-    logger = logging.getLogger(name)
-    if logger.handlers:
-        return logger  # already configured
+# Shared queue feeding the single background listener thread.
+_log_queue: queue.Queue = queue.Queue(-1)
+_listener: Optional[QueueListener] = None
 
-    logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
+def _start_listener() -> QueueListener:
+    """Build the I/O handlers and start the background listener once."""
+    global _listener
+    if _listener is not None:
+        return _listener
 
     # Console handler
     ch = logging.StreamHandler()
@@ -40,6 +40,48 @@ def get_logger(name: str = __name__) -> logging.Logger:
     fh_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     fh.setFormatter(fh_formatter)
 
-    logger.addHandler(ch)
-    logger.addHandler(fh)
+    _listener = QueueListener(_log_queue, ch, fh, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
+
+def _restart_listener_in_child() -> None:
+    """Restart the listener after fork; threads don't survive into the child.
+
+    Without this, prefork Celery workers would enqueue records into a queue
+    nothing drains. The inherited queue's condition variable still lists the
+    dead parent thread as a waiter and would swallow notifications, so the
+    child gets a fresh queue and every QueueHandler is re-pointed at it.
+    Mirrors the engine.dispose() fork handling in tasks.py.
+    """
+    global _listener, _log_queue
+    if _listener is None:
+        return
+    _log_queue = queue.Queue(-1)
+    for existing in logging.Logger.manager.loggerDict.values():
+        if isinstance(existing, logging.Logger):
+            for handler in existing.handlers:
+                if isinstance(handler, QueueHandler):
+                    handler.queue = _log_queue
+    _listener = None
+    _start_listener()
+
+os.register_at_fork(after_in_child=_restart_listener_in_child)
+
+def get_logger(name: str = __name__) -> logging.Logger:
+    """Create and return a configured logger.
+
+    Args:
+        name: Logger name (usually __name__ from the calling module).
+
+    Returns:
+        Configured `logging.Logger` instance.
+    """
+    logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger  # already configured
+
+    _start_listener()
+    logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
+    logger.addHandler(QueueHandler(_log_queue))
     return logger
@@ -1,10 +1,13 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
 from contextlib import asynccontextmanager
+from pathlib import Path
 from api import router
-from db import init_db
+from config import settings
+from db import init_db, engine
 from logger import get_logger
 import uvicorn
 
@@ -15,14 +18,16 @@ async def lifespan(app: FastAPI):
     """Handle application startup and shutdown lifecycle."""
     try:
         logger.info("Starting CAIP application...")
+        Path(settings.MEDIA_ROOT).mkdir(parents=True, exist_ok=True)
         await init_db()
         yield
     except Exception as e:
         logger.exception(f"Startup error: {e}")
     finally:
         logger.info("CAIP application shutting down...")
+        await engine.dispose()
 
-app = FastAPI(title="Call Analytics & Insights Platform (CAIP)", lifespan=lifespan)
+app = FastAPI(title="Call Analytics & Insights Platform (CAIP)", lifespan=lifespan, default_response_class=ORJSONResponse)
 app.include_router(router, prefix="/api")
 
 
@@ -3,7 +3,8 @@
 
 Defines Company, CallRecord, and CallInsight models with relationships.
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, JSON, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, JSON, Enum, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -35,8 +36,16 @@ class Company(Base):
     calls = relationship("CallRecord", back_populates="company", cascade="all, delete-orphan")
 
 class CallRecord(Base):
-    """Stores metadata for a single call and path to the recording file."""
+    """Stores metadata for a single call and path to the recording file.
+
+    Composite indexes cover the hot query shapes: listing/reporting filters
+    on (company_id, is_processed, start_time) and duration-range filters.
+    """
     __tablename__ = "callrecord"
+    __table_args__ = (
+        Index('ix_callrecord_company_processed_start', 'company_id', 'is_processed', 'start_time'),
+        Index('ix_callrecord_company_duration', 'company_id', 'duration'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     company_id = Column(Integer, ForeignKey("company.id"), index=True, nullable=False)
@@ -60,7 +69,8 @@ class CallInsight(Base):
     call_id = Column(Integer, ForeignKey("callrecord.id"), unique=True, nullable=False)
     transcription = Column(Text, nullable=True)
     sentiment = Column(Enum(SentimentEnum), nullable=True)
-    keywords = Column(JSON, nullable=True)
+    # JSONB on Postgres (binary storage, GIN-indexable); plain JSON elsewhere.
+    keywords = Column(JSON().with_variant(JSONB(), 'postgresql'), nullable=True)
     summary = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
@@ -1,6 +1,6 @@
 
 """Pydantic request and response schemas used by FastAPI endpoints."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
 
@@ -25,8 +25,7 @@ class CallRead(BaseModel):
     is_processed: bool
     recording_file: Optional[str]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class InsightRead(BaseModel):
     """Schema returned for call insights."""
@@ -36,5 +35,4 @@ class InsightRead(BaseModel):
     summary: Optional[str]
     created_at: Optional[datetime]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
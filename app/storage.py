@@ -3,10 +3,36 @@
 from pathlib import Path
 from config import settings
 from uuid import uuid4
+import asyncio
+import os
+import shutil
 
-def save_upload_file(file_obj, company_id: int, filename: str) -> str:
+# 1 MB chunks keep per-byte syscall overhead low without holding the
+# whole upload in memory.
+CHUNK_SIZE = 1024 * 1024
+
+def _copy_to_disk(src, dest: Path) -> None:
+    """Copy an open binary file to dest, staying out of Python where possible.
+
+    Uses os.copy_file_range (zero-copy between descriptors on Linux) and
+    falls back to shutil.copyfileobj if the kernel path is unavailable.
+    Runs in a worker thread; must not touch the event loop.
+    """
+    src.seek(0)
+    with open(dest, "wb") as out:
+        try:
+            while os.copy_file_range(src.fileno(), out.fileno(), CHUNK_SIZE):
+                pass
+        except (AttributeError, OSError):
+            # copy_file_range is Linux-only and can fail across filesystems;
+            # both descriptors' offsets have advanced, so resuming is safe.
+            shutil.copyfileobj(src, out, length=CHUNK_SIZE)
+
+async def save_upload_file(file_obj, company_id: int, filename: str) -> str:
     """Save an UploadFile to disk under MEDIA_ROOT/<company_id>/ and return path.
 
+    The copy runs in a worker thread so uploads never block the event loop.
+
     Args:
         file_obj: FastAPI UploadFile object.
         company_id: Company primary key used to namespace files.
@@ -19,11 +45,9 @@ def save_upload_file(file_obj, company_id: int, filename: str) -> str:
     root.mkdir(parents=True, exist_ok=True)
     safe_name = f"{uuid4().hex}-{Path(filename).name}"
     dest = root / safe_name
-    # Stream write to avoid loading entire file in memory
-    with open(dest, "wb") as out:
-        while True:
-            chunk = file_obj.file.read(1024 * 64)
-            if not chunk:
-                break
-            out.write(chunk)
+    # UploadFile wraps a SpooledTemporaryFile; roll it over so it has a
+    # real file descriptor for copy_file_range.
+    if hasattr(file_obj.file, "rollover"):
+        file_obj.file.rollover()
+    await asyncio.to_thread(_copy_to_disk, file_obj.file, dest)
     return str(dest)
@@ -1,11 +1,14 @@
 
 """Celery tasks with robust logging and error handling."""
 from celery_app import celery
+from celery.signals import worker_process_init
 from time import sleep
-import random, os, json
+import random, os
+import orjson
+import redis as redis_lib
 from datetime import datetime
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker, scoped_session
 from config import settings
 from models import CallRecord, CallInsight, SentimentEnum
 from logger import get_logger
@@ -23,8 +26,34 @@ def _sync_db_url(async_url: str) -> str:
     return async_url.replace("+asyncpg", "")  # naive conversion for example
 
 SYNC_DB_URL = _sync_db_url(settings.DATABASE_URL)
-engine = create_engine(SYNC_DB_URL, connect_args={})
-Session = sessionmaker(bind=engine)
+# Long-lived pooled engine: tasks check connections out of the pool instead
+# of paying connection setup/teardown per invocation.
+engine = create_engine(SYNC_DB_URL, pool_size=10, max_overflow=20, pool_pre_ping=True, pool_recycle=1800)
+Session = scoped_session(sessionmaker(bind=engine))
+
+# Celery delivers at-least-once, so insight writes must be idempotent;
+# both Postgres and SQLite expose the same ON CONFLICT insert API.
+if engine.dialect.name == "postgresql":
+    from sqlalchemy.dialects.postgresql import insert as upsert_insert
+else:
+    from sqlalchemy.dialects.sqlite import insert as upsert_insert
+
+# Hoisted constants for the simulated insight so the hot task path doesn't
+# rebuild them per invocation.
+_SENTIMENTS = tuple(SentimentEnum)
+_KEYWORDS = {"topics": ["support", "billing", "upgrade"]}
+
+# Sync client used only to invalidate cached report responses after a write.
+_redis = redis_lib.Redis.from_url(settings.REDIS_URL, socket_connect_timeout=0.5, socket_timeout=0.5)
+
+@worker_process_init.connect
+def _reset_engine_pool(**kwargs):
+    """Drop inherited connections after a prefork worker forks.
+
+    Pooled connections must not be shared across processes; disposing the
+    engine makes each worker build its own pool on first use.
+    """
+    engine.dispose()
 
 @celery.task(bind=True)
 def process_call_record(self, call_record_id: int):
@@ -36,7 +65,7 @@ def process_call_record(self, call_record_id: int):
     session = Session()
     try:
         logger.info("Starting processing for CallRecord id=%s", call_record_id)
-        cr = session.query(CallRecord).get(call_record_id)
+        cr = session.get(CallRecord, call_record_id)
         if not cr:
             logger.error("CallRecord id=%s not found", call_record_id)
             return {"error": "callrecord not found"}
@@ -44,18 +73,22 @@ def process_call_record(self, call_record_id: int):
         # Simulate processing time
         sleep(random.uniform(0.5, 2.0))
 
-        # Create CallInsight
-        insight = CallInsight(
+        # Upsert the CallInsight so task re-delivery cannot raise on the
+        # unique call_id; mark the record processed in the same transaction.
+        values = dict(
             call_id=cr.id,
             transcription=f"Simulated transcription for {cr.call_id}",
-            sentiment=random.choice(list(SentimentEnum)),
-            keywords={"topics": ["support", "billing", "upgrade"]},
+            sentiment=random.choice(_SENTIMENTS),
+            keywords=_KEYWORDS,
             summary="Simulated summary of the call.",
             created_at=datetime.utcnow()
         )
-        session.add(insight)
-        cr.is_processed = True
-        session.add(cr)
+        stmt = upsert_insert(CallInsight).values(**values).on_conflict_do_update(
+            index_elements=['call_id'],
+            set_={k: v for k, v in values.items() if k != 'call_id'}
+        )
+        session.execute(stmt)
+        session.execute(update(CallRecord).where(CallRecord.id == cr.id).values(is_processed=True))
         session.commit()
         logger.info("Successfully processed CallRecord id=%s", call_record_id)
         return {"ok": True, "call_id": cr.call_id}
@@ -70,21 +103,28 @@ def process_call_record(self, call_record_id: int):
         session.close()
 
 @celery.task(bind=True)
-def generate_company_report(self, company_id: int):
+def generate_company_report(self, company_id: int, pretty: bool = False):
     """Aggregate processed calls for a company and write a JSON report file.
 
-    All unexpected errors are logged with exception level and re-raised.
+    Reports are written compact by default; pass pretty=True for an
+    indented, human-readable file. All unexpected errors are logged with
+    exception level and re-raised.
     """
     session = Session()
     try:
         logger.info("Generating report for company_id=%s", company_id)
-        calls = session.query(CallRecord).filter(CallRecord.company_id == company_id, CallRecord.is_processed == True).all()
-        total = len(calls)
-        avg_duration = sum((c.duration or 0) for c in calls) / total if total else 0
+        # Single JOIN instead of one insight query per call (N+1).
+        rows = (
+            session.query(CallRecord.duration, CallInsight.sentiment)
+            .outerjoin(CallInsight, CallInsight.call_id == CallRecord.id)
+            .filter(CallRecord.company_id == company_id, CallRecord.is_processed == True)
+            .all()
+        )
+        total = len(rows)
+        avg_duration = sum((duration or 0) for duration, _ in rows) / total if total else 0
         sentiments = {}
-        for c in calls:
-            ins = session.query(CallInsight).filter(CallInsight.call_id == c.id).one_or_none()
-            s = (ins.sentiment.value if ins and ins.sentiment else 'Unknown')
+        for _, sentiment in rows:
+            s = sentiment.value if sentiment else 'Unknown'
             sentiments[s] = sentiments.get(s, 0) + 1
         report = {
             "company_id": company_id,
@@ -96,9 +136,13 @@ def generate_company_report(self, company_id: int):
         reports_dir = os.path.join(settings.MEDIA_ROOT, 'reports', str(company_id))
         os.makedirs(reports_dir, exist_ok=True)
         path = os.path.join(reports_dir, f"report-{int(datetime.utcnow().timestamp())}.json")
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 if pretty else 0))
         logger.info("Report written to %s", path)
+        try:
+            _redis.delete(f"report:{company_id}")
+        except Exception as exc:
+            logger.warning("Failed to invalidate report cache for company_id=%s: %s", company_id, exc)
         return {"ok": True, "path": path}
     except Exception as exc:
         logger.exception("Failed to generate report for company_id=%s: %s", company_id, exc)
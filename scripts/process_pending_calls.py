@@ -3,18 +3,35 @@
 import asyncio
 from app.db import AsyncSessionLocal
 from sqlalchemy import select
+from celery import group
 from app.models import CallRecord
 from app.tasks import process_call_record as celery_process_call
 
+# Stream rows and submit signatures in batches so memory stays flat and
+# the broker sees one pipelined round-trip per batch instead of one per task.
+BATCH_SIZE = 1000
+
 async def main():
     """Query the database for pending calls and enqueue tasks for processing."""
     async with AsyncSessionLocal() as session:
-        q = select(CallRecord).where(CallRecord.is_processed == False)
-        res = await session.execute(q)
-        pending = res.scalars().all()
-        print(f"Found {len(pending)} pending calls")
-        for p in pending:
-            celery_process_call.delay(p.id)
+        q = (
+            select(CallRecord.id)
+            .where(CallRecord.is_processed == False)
+            .execution_options(yield_per=BATCH_SIZE)
+        )
+        res = await session.stream(q)
+        total = 0
+        batch = []
+        async for (record_id,) in res:
+            batch.append(record_id)
+            if len(batch) >= BATCH_SIZE:
+                group(celery_process_call.s(i) for i in batch).apply_async()
+                total += len(batch)
+                batch.clear()
+        if batch:
+            group(celery_process_call.s(i) for i in batch).apply_async()
+            total += len(batch)
+        print(f"Enqueued {total} pending calls")
 
 if __name__ == '__main__':
     asyncio.run(main())